@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Dict, Optional, Set, List, Tuple
 
 import requests
-import pytz
+from zoneinfo import ZoneInfo
 
 from heart_beat_config_entry import HeartBeatConfigEntry
 from sys_config_entry import SysConfigEntry
@@ -32,11 +32,11 @@ def parse_ok_notify_hours(hours_str: str) -> Optional[Set[int]]:
     return {int(hour.strip()) for hour in hours_str.split(',')} if hours_str else None
 
 def check_and_write_notify_hour_file(file_path: str, ok_notify_hours: Optional[Set[int]]) -> bool:
-    current_hour = datetime.now(pytz.timezone('Asia/Shanghai')).hour
+    current_hour = datetime.now(ZoneInfo('Asia/Shanghai')).hour
     
     if ok_notify_hours is None or current_hour in ok_notify_hours:
         try:
-            with open(file_path, "r") as file:
+            with open(file_path, "rb") as file:
                 if int(file.read().strip()) == current_hour:
                     return False
         except (FileNotFoundError, ValueError):
@@ -81,7 +81,7 @@ def check_monitor_url(url: str, notifier: NotifyEntry, sys_config_entry: SysConf
     if check_monitor_url_dns(url, notifier):
         check_monitor_url_visit(url, notifier, sys_config_entry)
 
-def all_host_make_heart_beat(config_entries: List[Dict], heart_beat_entry_file: str, heart_beat_extra_info: Dict, local_host_name: str, local_user_name: str) -> None:
+def all_host_make_heart_beat(config_entries: List[Dict], heart_beat_entry_file: str, heart_beat_extra_info: Optional[utils.HeartBeatInfo], local_host_name: str, local_user_name: str) -> None:
     for host_id, entry in enumerate(config_entries, 1):
         client = entry.get('client')
         hostname = entry.get('hostname')
@@ -117,7 +117,7 @@ def main() -> None:
         private_key_file = utils.get_ssh_ed25519_pri(user_name)
 
         heat_beat_extra_info = utils.parse_heart_beat_extra_info(os.environ.get('HEART_BEAT_EXTRA_INFO'))
-        msg = (f"==> 心跳来自主机[{heat_beat_extra_info['username']}@{heat_beat_extra_info['hostname']}:{heat_beat_extra_info['port']}] 类型:{heat_beat_extra_info['type']}"
+        msg = (f"==> 心跳来自主机[{heat_beat_extra_info.username}@{heat_beat_extra_info.hostname}:{heat_beat_extra_info.port}] 类型:{heat_beat_extra_info.type}"
                if heat_beat_extra_info else
                f"==> 心跳来自当前主机自身[{user_name}@{host_name}] heat_beat_extra_info={heat_beat_extra_info}")
         logger.info(msg)
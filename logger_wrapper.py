@@ -1,10 +1,27 @@
 import os
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
-import pytz
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from zoneinfo import ZoneInfo
 from datetime import datetime
 
-beijing_tz = pytz.timezone('Asia/Shanghai')
+beijing_tz = ZoneInfo('Asia/Shanghai')
+_LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'log')
+_WEEKDAYS = ("星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日")
+
+class BeijingFormatter(logging.Formatter):
+    # 时间前缀精确到秒，同一秒内的日志复用上一次的结果
+    _cached_second = None
+    _cached_time = ''
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            now = datetime.fromtimestamp(second, beijing_tz)
+            self._cached_time = now.strftime('%Y-%m-%d %H:%M:%S') + ' - ' + _WEEKDAYS[now.weekday()]
+            self._cached_second = second
+        return self._cached_time
 
 class LoggerWrapper:
     _instance = None
@@ -18,42 +35,37 @@ class LoggerWrapper:
         if hasattr(self, '_initialized') and self._initialized:
             return
 
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        log_dir = os.path.join(script_dir, 'log')
-        os.makedirs(log_dir, exist_ok=True)
-        log_file_path = os.path.join(log_dir, log_file_name)
+        os.makedirs(_LOG_DIR, exist_ok=True)
+        log_file_path = os.path.join(_LOG_DIR, log_file_name)
 
         self.logger = logging.getLogger('serv00_ct8_nezha_logger')
         self.logger.setLevel(logging.INFO)
         
         if not self.logger.handlers:
             handler = RotatingFileHandler(log_file_path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
-            formatter = logging.Formatter('%(asctime)s - %(message)s')
+            formatter = BeijingFormatter('%(asctime)s - %(message)s')
             handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
 
-        self._initialized = True
+            # 调用方只把日志放入队列，由后台线程写文件
+            log_queue = queue.SimpleQueue()
+            self.logger.addHandler(QueueHandler(log_queue))
+            self._listener = QueueListener(log_queue, handler, respect_handler_level=True)
+            self._listener.start()
+            atexit.register(self._listener.stop)
 
-    def _log(self, level, message):
-        weekdays = ["星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日"]
-        current_weekday_name = weekdays[datetime.now(beijing_tz).weekday()]
-        beijing_time = datetime.now(beijing_tz).strftime('%Y-%m-%d %H:%M:%S')
-        log_entry = f"{beijing_time} - {current_weekday_name} - {message}"
-        
-        log_method = getattr(self.logger, level)
-        log_method(log_entry)
+        self._initialized = True
 
-    def info(self, message):
-        self._log('info', message)
+    def info(self, message, *args):
+        self.logger.info(message, *args)
 
-    def error(self, message):
-        self._log('error', message)
+    def error(self, message, *args):
+        self.logger.error(message, *args)
 
-    def warning(self, message):
-        self._log('warning', message)
+    def warning(self, message, *args):
+        self.logger.warning(message, *args)
 
-    def debug(self, message):
-        self._log('debug', message)
+    def debug(self, message, *args):
+        self.logger.debug(message, *args)
 
-    def critical(self, message):
-        self._log('critical', message)
+    def critical(self, message, *args):
+        self.logger.critical(message, *args)
@@ -19,7 +19,7 @@ def gen_ed25519(utils_sh_file: str, ssh_dir: str) -> None:
         'auth': f'{ssh_dir}/authorized_keys'
     }
 
-    if not all(utils.check_file_exists(os.path.expanduser(file)) for file in ed25519_files.values()):
+    if not all(utils.check_file_exists(file) for file in ed25519_files.values()):
         print("公私钥缺失异常，请检查~/.ssh/目录")
         sys.exit(1)
 
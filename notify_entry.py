@@ -1,4 +1,8 @@
 #!/usr/bin/env python3
+import os
+import threading
+import concurrent.futures
+from typing import Optional
 from logger_wrapper import LoggerWrapper
 from sys_config_entry import SysConfigEntry
 from qywx_notify import QywxNotify
@@ -6,25 +10,45 @@ from qywx_app_notify import QywxAppNotify
 from tg_notify import TgNotify
 from pushplus_notify import PushPlusNotify
 
+# 各通知渠道都是一次阻塞的HTTPS请求，并行发送；只在第一次发送通知时创建线程池
+_thread_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_thread_pool_lock = threading.Lock()
+
+def _get_pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _thread_pool
+    if _thread_pool is None:
+        with _thread_pool_lock:
+            if _thread_pool is None:
+                _thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4),
+                                                                     thread_name_prefix="serv00-io")
+    return _thread_pool
+
 class NotifyEntry:
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls, sys_config_entry: SysConfigEntry):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._initialized = False
         return cls._instance
 
     def __init__(self, sys_config_entry: SysConfigEntry):
         if getattr(self, '_initialized', False):
             return
-        self._initialized = True
-        self.logger = LoggerWrapper()
-        self.sys_config_entry = sys_config_entry
-        self.qywx_notify = QywxNotify(self.sys_config_entry) if self.sys_config_entry.get("ENABLE_QYWX_NOTIFY") == "1" else None
-        self.qywx_app_notify = QywxAppNotify(self.sys_config_entry) if self.sys_config_entry.get("ENABLE_QYWX_APP_NOTIFY") == "1" else None
-        self.tg_notify = TgNotify(self.sys_config_entry) if self.sys_config_entry.get("ENABLE_TG_NOTIFY") == "1" else None
-        self.pushplus_notify = PushPlusNotify(self.sys_config_entry) if self.sys_config_entry.get("ENABLE_PUSHPLUS_NOTIFY") == "1" else None
+        with self._lock:
+            if getattr(self, '_initialized', False):
+                return
+            self.logger = LoggerWrapper()
+            self.sys_config_entry = sys_config_entry
+            self.qywx_notify = QywxNotify(self.sys_config_entry) if self.sys_config_entry.get("ENABLE_QYWX_NOTIFY") == "1" else None
+            self.qywx_app_notify = QywxAppNotify(self.sys_config_entry) if self.sys_config_entry.get("ENABLE_QYWX_APP_NOTIFY") == "1" else None
+            self.tg_notify = TgNotify(self.sys_config_entry) if self.sys_config_entry.get("ENABLE_TG_NOTIFY") == "1" else None
+            self.pushplus_notify = PushPlusNotify(self.sys_config_entry) if self.sys_config_entry.get("ENABLE_PUSHPLUS_NOTIFY") == "1" else None
+            self._notifiers = [notifier for notifier in (self.qywx_notify, self.qywx_app_notify, self.tg_notify, self.pushplus_notify) if notifier]
+            self._initialized = True
 
     def check_monitor_url_dns_fail_notify(self, url: str, e: Exception):
         self._send_notify("check_monitor_url_dns_fail_notify", url=url, e=e)
@@ -36,11 +60,10 @@ class NotifyEntry:
         self._send_notify("check_monitor_url_visit_fail_notify", url=url, response=response)
 
     def _send_notify(self, method_name: str, **kwargs):
-        if self.qywx_notify:
-            getattr(self.qywx_notify, method_name)(**kwargs)
-        if self.qywx_app_notify:
-            getattr(self.qywx_app_notify, method_name)(**kwargs)
-        if self.tg_notify:
-            getattr(self.tg_notify, method_name)(**kwargs)
-        if self.pushplus_notify:
-            getattr(self.pushplus_notify, method_name)(**kwargs)
+        pool = _get_pool()
+        futures = [pool.submit(getattr(notifier, method_name), **kwargs) for notifier in self._notifiers]
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error(f"发送通知[{method_name}]异常: {str(e)}")
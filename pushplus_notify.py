@@ -1,28 +1,36 @@
+import threading
 import requests
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 from typing import Dict
 from logger_wrapper import LoggerWrapper
 from sys_config_entry import SysConfigEntry
 
 class PushPlusNotify:
     _instance = None
+    _lock = threading.Lock()
     PUSHPLUS_API_URL = 'http://www.pushplus.plus/send'
 
     def __new__(cls, sys_config_entry: SysConfigEntry):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._initialized = False
         return cls._instance
 
     def __init__(self, sys_config_entry: SysConfigEntry):
         if self._initialized:
             return
-        self._initialized = True
-        self.sys_config_entry = sys_config_entry
-        self.logger = LoggerWrapper()
-        self.api_token = self.sys_config_entry.get("PUSHPLUS_KEY")
-        self.headers = {'Content-Type': 'application/json'}
+        with self._lock:
+            if self._initialized:
+                return
+            self.sys_config_entry = sys_config_entry
+            self.logger = LoggerWrapper()
+            self.api_token = self.sys_config_entry.get("PUSHPLUS_KEY")
+            self.headers = {'Content-Type': 'application/json'}
+            self.session = requests.Session()
+            self._initialized = True
 
     def check_monitor_url_dns_fail_notify(self, url: str, e: Exception):
         title = "💣解析失败提醒💣"
@@ -44,7 +52,7 @@ class PushPlusNotify:
 
     def _build_message(self, title: str, content: str) -> Dict[str, str]:
         system_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        beijing_time = datetime.now(pytz.timezone('Asia/Shanghai')).strftime('%Y-%m-%d %H:%M:%S')
+        beijing_time = datetime.now(ZoneInfo('Asia/Shanghai')).strftime('%Y-%m-%d %H:%M:%S')
         return {
             "token": self.api_token,
             "title": title,
@@ -54,7 +62,7 @@ class PushPlusNotify:
     def _send_notify(self, title: str, content: str) -> None:
         message = self._build_message(title, content)
         try:
-            with requests.post(self.PUSHPLUS_API_URL, json=message, headers=self.headers, timeout=2) as response:
+            with self.session.post(self.PUSHPLUS_API_URL, json=message, headers=self.headers, timeout=2) as response:
                 response.raise_for_status()
                 self.logger.info(f"PushPlus推送消息成功: {response.text}")
         except requests.RequestException as e:
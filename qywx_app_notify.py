@@ -1,35 +1,50 @@
+import threading
 import requests
 from typing import List, Optional, Dict
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 from logger_wrapper import LoggerWrapper
 from sys_config_entry import SysConfigEntry
 
 class QywxAppNotify:
     _instance = None
+    _lock = threading.Lock()
     QYWX_APP_TOKEN_URL = 'https://qyapi.weixin.qq.com/cgi-bin/gettoken'
     QYWX_APP_PUSH_URL = 'https://qyapi.weixin.qq.com/cgi-bin/message/send'
 
     def __new__(cls, sys_config_entry: SysConfigEntry):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._initialized = False
         return cls._instance
 
     def __init__(self, sys_config_entry: SysConfigEntry):
         if getattr(self, '_initialized', False):
             return
-        self._initialized = True
-        self.sys_config_entry = sys_config_entry
-        self.logger = LoggerWrapper()
+        with self._lock:
+            if getattr(self, '_initialized', False):
+                return
+            self.sys_config_entry = sys_config_entry
+            self.logger = LoggerWrapper()
 
-        self.qywx_app_corp_id = self.sys_config_entry.get("QYWX_APP_CROP_ID")
-        self.qywx_app_secret = self.sys_config_entry.get("QYWX_APP_SECRET")
-        self.qywx_app_agent_id = self.sys_config_entry.get("QYWX_APP_AGENT_ID")
-        self.qywx_app_notify_user = self.sys_config_entry.get("QYWX_APP_NOTIFY_USER", '@all')
+            self.qywx_app_corp_id = self.sys_config_entry.get("QYWX_APP_CROP_ID")
+            self.qywx_app_secret = self.sys_config_entry.get("QYWX_APP_SECRET")
+            self.qywx_app_agent_id = self.sys_config_entry.get("QYWX_APP_AGENT_ID")
+            self.qywx_app_notify_user = self.sys_config_entry.get("QYWX_APP_NOTIFY_USER", '@all')
 
-        self.qywx_app_token_url = f"{self.QYWX_APP_TOKEN_URL}?corpid={self.qywx_app_corp_id}&corpsecret={self.qywx_app_secret}"
-        self.headers = {'Content-Type': 'application/json'}
+            self.qywx_app_token_url = f"{self.QYWX_APP_TOKEN_URL}?corpid={self.qywx_app_corp_id}&corpsecret={self.qywx_app_secret}"
+            self.headers = {'Content-Type': 'application/json'}
+            self._body_template = {
+                "touser": self.qywx_app_notify_user,
+                "agentid": self.qywx_app_agent_id,
+                "safe": 0,
+                "enable_id_trans": 0,
+                "enable_duplicate_check": 0
+            }
+            self.session = requests.Session()
+            self._initialized = True
 
     def check_monitor_url_dns_fail_notify(self, url: str, e: Exception) -> None:
         title = "[炸弹]解析失败提醒[炸弹]"
@@ -51,7 +66,7 @@ class QywxAppNotify:
 
     def _build_message(self, title: str, content: str) -> Dict[str, Dict[str, str]]:
         system_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        beijing_time = datetime.now(pytz.timezone('Asia/Shanghai')).strftime('%Y-%m-%d %H:%M:%S')
+        beijing_time = datetime.now(ZoneInfo('Asia/Shanghai')).strftime('%Y-%m-%d %H:%M:%S')
         return {
             "msgtype": "text",
             "text": {
@@ -69,7 +84,7 @@ class QywxAppNotify:
 
     def _get_access_token(self) -> Optional[str]:
         try:
-            response = requests.get(self.qywx_app_token_url, timeout=2)
+            response = self.session.get(self.qywx_app_token_url, timeout=2)
             response.raise_for_status()
             access_token = response.json().get("access_token")
             if not access_token:
@@ -81,17 +96,11 @@ class QywxAppNotify:
 
     def _send_message(self, access_token: str, message: Dict[str, Dict[str, str]]) -> None:
         url = f"{self.QYWX_APP_PUSH_URL}?access_token={access_token}"
-        body = {
-            "touser": self.qywx_app_notify_user,
-            "agentid": self.qywx_app_agent_id,
-            "safe": 0,
-            "enable_id_trans": 0,
-            "enable_duplicate_check": 0,
-            **message
-        }
+        body = self._body_template.copy()
+        body.update(message)
 
         try:
-            with requests.post(url, json=body, headers=self.headers, timeout=2) as response:
+            with self.session.post(url, json=body, headers=self.headers, timeout=2) as response:
                 response.raise_for_status()
                 self.logger.info(f"企业微信APP推送消息成功: {response.text}")
         except requests.RequestException as e:
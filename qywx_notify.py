@@ -1,29 +1,37 @@
+import threading
 import requests
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 from typing import Dict
 from logger_wrapper import LoggerWrapper
 from sys_config_entry import SysConfigEntry
 
 class QywxNotify:
     _instance = None
+    _lock = threading.Lock()
     QYWX_API_URL = 'https://qyapi.weixin.qq.com/cgi-bin/webhook/send?key={}'
 
     def __new__(cls, sys_config_entry: SysConfigEntry):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._initialized = False
         return cls._instance
 
     def __init__(self, sys_config_entry: SysConfigEntry):
         if getattr(self, '_initialized', False):
             return
-        self._initialized = True
-        self.sys_config_entry = sys_config_entry
-        self.logger = LoggerWrapper()
-        self.qywx_robot_key = self.sys_config_entry.get("QYWX_ROBOT_KEY")
-        self.qywx_robot_url = self.QYWX_API_URL.format(self.qywx_robot_key)
-        self.headers = {'Content-Type': 'application/json'}
+        with self._lock:
+            if getattr(self, '_initialized', False):
+                return
+            self.sys_config_entry = sys_config_entry
+            self.logger = LoggerWrapper()
+            self.qywx_robot_key = self.sys_config_entry.get("QYWX_ROBOT_KEY")
+            self.qywx_robot_url = self.QYWX_API_URL.format(self.qywx_robot_key)
+            self.headers = {'Content-Type': 'application/json'}
+            self.session = requests.Session()
+            self._initialized = True
 
     def check_monitor_url_dns_fail_notify(self, url: str, e: Exception):
         title = "[炸弹]解析失败提醒[炸弹]"
@@ -45,7 +53,7 @@ class QywxNotify:
 
     def _build_message(self, title: str, content: str) -> Dict[str, Dict[str, str]]:
         system_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        beijing_time = datetime.now(pytz.timezone('Asia/Shanghai')).strftime('%Y-%m-%d %H:%M:%S')
+        beijing_time = datetime.now(ZoneInfo('Asia/Shanghai')).strftime('%Y-%m-%d %H:%M:%S')
         return {
             "msgtype": "text",
             "text": {
@@ -56,7 +64,7 @@ class QywxNotify:
     def _send_notify(self, title: str, content: str) -> None:
         message = self._build_message(title, content)
         try:
-            with requests.post(self.qywx_robot_url, json=message, headers=self.headers, timeout=2) as response:
+            with self.session.post(self.qywx_robot_url, json=message, headers=self.headers, timeout=2) as response:
                 response.raise_for_status()
                 self.logger.info(f"企业微信机器人推送消息成功: {response.text}")
         except requests.RequestException as e:
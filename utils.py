@@ -1,8 +1,10 @@
 import os
-import socket
+import sys
 import shlex
+import subprocess
 import functools
-from time import time
+from collections import namedtuple
+from time import perf_counter
 from getpass import getuser
 
 from logger_wrapper import LoggerWrapper
@@ -11,12 +13,15 @@ from logger_wrapper import LoggerWrapper
 # 初始化日志记录器
 logger = LoggerWrapper()
 
+HeartBeatInfo = namedtuple("HeartBeatInfo", "type hostname port username")
+_VALID_YN = frozenset(('y', 'n'))
+
 def time_count(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time()
+        start_time = perf_counter()
         result = func(*args, **kwargs)
-        end_time = time()
+        end_time = perf_counter()
         elapsed_time = end_time - start_time
 
         if elapsed_time < 60:
@@ -29,14 +34,28 @@ def time_count(func):
         return result
     return wrapper
 
+def _quote_shell_arg(arg):
+    # 数字参数不包含shell特殊字符，不需要转义
+    if isinstance(arg, (int, float)):
+        return str(arg)
+    return shlex.quote(str(arg))
+
 def get_shell_run_cmd(shell_path, *args):
-    quoted_args = [shlex.quote(str(arg)) for arg in args]
+    if not args:
+        return shell_path
+    if len(args) == 1:
+        return f'{shell_path} {_quote_shell_arg(args[0])}'
+    quoted_args = [_quote_shell_arg(arg) for arg in args]
     return f'{shell_path} {" ".join(quoted_args)}'
 
 def run_shell_script_with_os(shell_path, *args):
     cmd = get_shell_run_cmd(shell_path, *args)
-    result = os.system(cmd)
-    
+    try:
+        result = subprocess.run([shell_path, *map(str, args)], check=False).returncode
+    except OSError as e:
+        logger.error(f"Shell command execution failed with error {e}: {cmd}")
+        return False
+
     if result == 0:
         logger.info(f"Shell command executed successfully: {cmd}")
         return True
@@ -46,43 +65,50 @@ def run_shell_script_with_os(shell_path, *args):
 
 
 def overwrite_msg_to_file(msg, file_path):
-    with open(file_path, "w", encoding="utf-8") as file:
-        file.write(str(msg))
+    data = str(msg).encode("utf-8")
+    with open(file_path, "wb") as file:
+        file.write(data)
 
+@functools.lru_cache(maxsize=1)
 def get_hostname_and_username():
-    hostname = socket.gethostname()
+    hostname = os.uname().nodename
     try:
         username = os.getlogin()
     except OSError:
         username = getuser()
     return hostname, username
 
+@functools.lru_cache(maxsize=None)
 def get_user_home_dir(user_name):
-    return os.path.join('/home', user_name)
+    return f'/home/{user_name}'
 
+@functools.lru_cache(maxsize=None)
 def get_ssh_dir(user_name):
-    return os.path.join(get_user_home_dir(user_name), '.ssh')
+    return f'/home/{user_name}/.ssh'
 
+@functools.lru_cache(maxsize=None)
 def get_app_dir(user_name):
-    return os.path.join(get_user_home_dir(user_name), 'nezha_app')
+    return f'/home/{user_name}/nezha_app'
 
+@functools.lru_cache(maxsize=None)
 def get_dashboard_dir(user_name):
-    return os.path.join(get_app_dir(user_name), 'dashboard')
+    return f'/home/{user_name}/nezha_app/dashboard'
 
+@functools.lru_cache(maxsize=None)
 def get_dashboard_config_file(user_name):
-    config_dir = get_dashboard_dir(user_name)
-    return os.path.join(config_dir, 'data/config.yaml')
+    return f'/home/{user_name}/nezha_app/dashboard/data/config.yaml'
 
+@functools.lru_cache(maxsize=None)
 def get_dashboard_db_file(user_name):
-    dashboard_dir = get_dashboard_dir(user_name)
-    return os.path.join(dashboard_dir, 'data/sqlite.db')
+    return f'/home/{user_name}/nezha_app/dashboard/data/sqlite.db'
 
+@functools.lru_cache(maxsize=None)
 def get_agent_dir(user_name):
-    return os.path.join(get_app_dir(user_name), 'agent')
+    return f'/home/{user_name}/nezha_app/agent'
 
+@functools.lru_cache(maxsize=None)
 def get_ssh_ed25519_pri(user_name):
-    ssh_dir = get_ssh_dir(user_name)
-    return os.path.expanduser(os.path.join(ssh_dir, 'id_ed25519'))
+    return f'/home/{user_name}/.ssh/id_ed25519'
 
 def get_serv00_config_dir(serv00_ct8_dir):
     return os.path.join(serv00_ct8_dir, 'config')
@@ -101,38 +127,34 @@ def parse_heart_beat_extra_info(info):
     if not info:
         return None
 
-    parts = info.split('|')
-    if len(parts) != 4:
+    if info.count('|') != 3:
         return None
 
-    opt, hostname, port, username = parts
-    return {
-        "type": opt,
-        "hostname": hostname,
-        "port": int(port),
-        "username": username
-    }
+    i1 = info.find('|')
+    i2 = info.find('|', i1 + 1)
+    i3 = info.find('|', i2 + 1)
+
+    return HeartBeatInfo(info[:i1], info[i1 + 1:i2], int(info[i2 + 1:i3]), info[i3 + 1:])
 
 def make_heart_beat_extra_info(info, host_name, user_name):
     if not info:
         return f"0|{host_name}|22|{user_name}"
 
-    return f"0|{info['hostname']}|{info['port']}|{info['username']}"
+    return f"0|{info.hostname}|{info.port}|{info.username}"
 
 def need_check_and_heart_beat(heat_beat_extra_info):
     # 自身定时任务执行
     if not heat_beat_extra_info:
         return True
     
-    return heat_beat_extra_info.get('type') != "0"
+    return heat_beat_extra_info.type != "0"
 
 def prompt_user_input(msg):
-    valid_inputs = {'y', 'n'}
-    
+    prompt = f"是否{msg}? (Y/y 是，N/n 否): "
     while True:
-        user_input = input(f"是否{msg}? (Y/y 是，N/n 否): ").strip().lower()
+        user_input = input(prompt).strip().lower()
         
-        if user_input in valid_inputs:
+        if user_input in _VALID_YN:
             return user_input == 'y'
         else:
-            logger.info("无效输入，请输入 Y 或者 y 执行，N 或者 n 不执行")
+            print("无效输入，请输入 Y 或者 y 执行，N 或者 n 不执行", file=sys.stderr)